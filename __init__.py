@@ -3,20 +3,44 @@
 This package implements a Clean Architecture RAG agent using A2A protocol.
 """
 
-import vertexai
 import os
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Initialize Vertex AI
-# This happens when the package is imported
-project = os.getenv("GOOGLE_CLOUD_PROJECT")
-location = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
+_vertex_initialized = False
+
+
+def ensure_vertex_initialized() -> bool:
+    """Initialize Vertex AI once per process.
+
+    The SDK is imported here rather than at module level so that importing
+    the package does not pay for it unless Vertex AI is actually used.
+
+    Returns:
+        True if Vertex AI is initialized, False if GOOGLE_CLOUD_PROJECT is not set
+    """
+    global _vertex_initialized
+    if _vertex_initialized:
+        return True
+
+    project = os.getenv("GOOGLE_CLOUD_PROJECT")
+    location = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
+
+    if not project:
+        print("Warning: GOOGLE_CLOUD_PROJECT not set. Vertex AI not initialized.")
+        return False
+
+    import vertexai
 
-if project:
     vertexai.init(project=project, location=location)
     print(f"Initialized Vertex AI with project: {project}, location: {location}")
-else:
-    print("Warning: GOOGLE_CLOUD_PROJECT not set. Vertex AI not initialized.")
\ No newline at end of file
+    _vertex_initialized = True
+    return True
+
+
+# Initialize Vertex AI on import unless the caller opts out
+# (e.g. client-only use that never touches Vertex AI)
+if not os.getenv("SKIP_VERTEX_INIT"):
+    ensure_vertex_initialized()
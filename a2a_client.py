@@ -1,25 +1,100 @@
 """Test client for Customer Communication Agent using A2A protocol."""
 import asyncio
+import itertools
+import os
 import sys
-import json
+import threading
 import uuid
 from typing import Optional
 import httpx
-from a2a.types import Part, TextPart
+import orjson
+
+# Connection pool tuning (override via environment for load tests)
+POOL_SIZE = int(os.getenv("A2A_POOL_SIZE", "32"))
+KEEPALIVE_EXPIRY = float(os.getenv("A2A_KEEPALIVE", "60"))
+# Maximum number of requests in flight during concurrent test runs
+CONCURRENCY = int(os.getenv("A2A_CONCURRENCY", "4"))
+
+# Headers shared by every JSON-RPC POST
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+async def ainput(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop.
+    
+    SHUTDOWN: `input()` runs in a daemon thread instead of the default
+    executor, so Ctrl+C at the prompt exits immediately rather than
+    waiting for the blocked read to return.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def _resolve(result: Optional[str], error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def _read() -> None:
+        try:
+            result, error = input(prompt), None
+        except BaseException as e:  # EOFError, KeyboardInterrupt, ...
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(_resolve, result, error)
+        except RuntimeError:
+            pass  # Loop already closed
+    
+    threading.Thread(target=_read, daemon=True).start()
+    return await future
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create an AsyncClient with the pooled keep-alive settings.
+    
+    SHARING: Pass the same instance to several clients to reuse one
+    connection pool between them.
+    """
+    # Keep connections alive between back-to-back calls to avoid new handshakes
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=POOL_SIZE,
+            max_keepalive_connections=POOL_SIZE,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+    )
 
 
 class CustomerTrackingClient:
     """Client for interacting with Customer Communication Agent via A2A protocol."""
     
-    def __init__(self, agent_url: str = "http://localhost:8006"):
+    def __init__(
+        self,
+        agent_url: str = "http://localhost:8006",
+        verify: bool = False,
+        httpx_client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize with agent URL.
         
         DEFAULT: Assumes A2A server at localhost:8006
+        
+        Args:
+            agent_url: Base URL of the A2A server
+            verify: Fetch the agent card before the first message is sent.
+                By default the first `message/send` surfaces connection errors.
+            httpx_client: Shared AsyncClient to use. The caller owns it and
+                is responsible for closing it; otherwise a private one is created.
         """
         self.agent_url = agent_url
-        self.httpx_client = httpx.AsyncClient(timeout=30.0)
-        self.connected = False
+        self._owns_http_client = httpx_client is None
+        self.httpx_client = httpx_client or create_http_client()
+        self.connected = not verify
         self.session_id = f"session-{uuid.uuid4().hex[:8]}"
+        # JSON-RPC ids only need to be unique within this client
+        self._next_id = itertools.count(1)
     
     async def connect(self):
         """Connect to the agent."""
@@ -27,7 +102,7 @@ class CustomerTrackingClient:
             # Check if agent is available
             response = await self.httpx_client.get(f"{self.agent_url}/.well-known/agent.json")
             if response.status_code == 200:
-                agent_info = response.json()
+                agent_info = orjson.loads(await response.aread())
                 print(f"✅ Connected to {agent_info['name']} v{agent_info['version']}")
                 self.connected = True
             else:
@@ -36,26 +111,17 @@ class CustomerTrackingClient:
             print(f"❌ Failed to connect to agent: {e}")
             raise
     
-    async def send_message(self, message: str) -> str:
-        """Send a message to the agent and get response.
-        
-        Args:
-            message: Natural language message
-            
-        Returns:
-            Agent's response as string
-        """
-        if not self.connected:
-            await self.connect()
-        
-        # Create JSON-RPC request using the correct format
-        request = {
+    def _build_request(self, message: str) -> dict:
+        """Build the JSON-RPC `message/send` request for a message."""
+        request_id = next(self._next_id)
+        return {
             "jsonrpc": "2.0",
-            "id": str(uuid.uuid4()),
+            "id": request_id,
             "method": "message/send",
             "params": {
                 "message": {
-                    "messageId": str(uuid.uuid4()),
+                    # A2A message ids are strings; prefix with the session to keep them unique
+                    "messageId": f"{self.session_id}-{request_id}",
                     "role": "user",
                     "parts": [
                         {
@@ -66,66 +132,130 @@ class CustomerTrackingClient:
                 "sessionId": self.session_id
             }
         }
+    
+    def _response_to_text(self, result: dict) -> str:
+        """Turn a single JSON-RPC response object into the agent's reply."""
+        if "result" in result:
+            # Extract text from result
+            return self._extract_text_from_result(result["result"])
+        elif "error" in result:
+            return f"Error: {result['error'].get('message', 'Unknown error')}"
+        else:
+            return f"Unexpected response format"
+    
+    def encode_requests(self, messages: list[str]) -> list[tuple[int, bytes]]:
+        """Encode messages into `(request id, JSON body)` pairs.
         
+        PRECOMPUTE: The encoded pairs can be passed to `send_requests`
+        any number of times without rebuilding or re-serializing them.
+        """
+        encoded = []
+        for message in messages:
+            request = self._build_request(message)
+            encoded.append((request["id"], orjson.dumps(request)))
+        return encoded
+    
+    async def _post_body(self, body: bytes) -> str:
+        """POST one encoded JSON-RPC request and return the agent's reply."""
         try:
             response = await self.httpx_client.post(
                 self.agent_url,
-                json=request,
-                headers={"Content-Type": "application/json"}
+                content=body,
+                headers=JSON_HEADERS
             )
             
             if response.status_code == 200:
-                result = response.json()
-                
-                if "result" in result:
-                    # Extract text from result
-                    return self._extract_text_from_result(result["result"])
-                elif "error" in result:
-                    return f"Error: {result['error'].get('message', 'Unknown error')}"
-                else:
-                    return f"Unexpected response format"
+                return self._response_to_text(orjson.loads(await response.aread()))
             else:
                 return f"HTTP Error {response.status_code}"
                 
         except Exception as e:
             return f"Request failed: {e}"
     
+    async def send_message(self, message: str) -> str:
+        """Send a message to the agent and get response.
+        
+        Args:
+            message: Natural language message
+            
+        Returns:
+            Agent's response as string
+        """
+        if not self.connected:
+            await self.connect()
+        
+        # Create JSON-RPC request using the correct format
+        return await self._post_body(orjson.dumps(self._build_request(message)))
+    
+    async def send_messages(self, messages: list[str]) -> list[str]:
+        """Send several messages concurrently.
+        
+        Args:
+            messages: Natural language messages
+            
+        Returns:
+            Agent's responses, in the same order as `messages`
+        """
+        return await self.send_requests(self.encode_requests(messages))
+    
+    async def send_requests(self, requests: list[tuple[int, bytes]]) -> list[str]:
+        """Send requests encoded by `encode_requests` concurrently.
+        
+        CONCURRENCY: One request per POST, with at most `CONCURRENCY` in
+        flight. (The A2A server rejects JSON-RPC batch arrays.)
+        
+        Args:
+            requests: `(request id, JSON body)` pairs
+            
+        Returns:
+            Agent's responses, in the same order as `requests`
+        """
+        if not self.connected:
+            await self.connect()
+        
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+        
+        async def _send_one(body: bytes) -> str:
+            async with semaphore:
+                return await self._post_body(body)
+        
+        return await asyncio.gather(*(_send_one(body) for _, body in requests))
+    
     def _extract_text_from_result(self, result):
         """Extract text from the JSON-RPC result."""
         try:
             if isinstance(result, dict):
+                get = result.get
+                
                 # Look for artifacts (the actual response format)
-                if "artifacts" in result and result["artifacts"]:
-                    texts = []
-                    for artifact in result["artifacts"]:
-                        if "parts" in artifact:
-                            for part in artifact["parts"]:
-                                if "text" in part:
-                                    texts.append(part["text"])
-                                elif "kind" in part and part["kind"] == "text" and "text" in part:
-                                    texts.append(part["text"])
-                    if texts:
-                        return "\n".join(texts)
+                artifacts = get("artifacts")
+                if artifacts:
+                    text = "\n".join(
+                        part["text"]
+                        for artifact in artifacts
+                        for part in artifact.get("parts", ())
+                        if "text" in part
+                    )
+                    if text:
+                        return text
                 
                 # Look for message content (alternative format)
-                if "message" in result and "parts" in result["message"]:
-                    parts = result["message"]["parts"]
-                    texts = []
-                    for part in parts:
-                        if "text" in part:
-                            texts.append(part["text"])
-                    if texts:
-                        return "\n".join(texts)
+                message = get("message")
+                if message:
+                    text = "\n".join(
+                        part["text"] for part in message.get("parts", ()) if "text" in part
+                    )
+                    if text:
+                        return text
                 
                 # Look for direct content
-                for field in ["content", "response", "text"]:
+                for field in ("content", "response", "text"):
                     if field in result:
                         return str(result[field])
                 
                 # If nothing found but there's a status
-                if "status" in result and "state" in result["status"]:
-                    if result["status"]["state"] == "completed":
-                        return "Task completed but no text response available"
+                if (get("status") or {}).get("state") == "completed":
+                    return "Task completed but no text response available"
             
             return "No response text found"
             
@@ -133,17 +263,29 @@ class CustomerTrackingClient:
             return f"Error extracting response: {e}"
     
     async def close(self):
-        """Close the client connection."""
+        """Close the client connection.
+        
+        A shared AsyncClient passed in by the caller is left open.
+        """
         self.connected = False
-        await self.httpx_client.aclose()
+        if self._owns_http_client:
+            await self.httpx_client.aclose()
+
+
+# Legacy name used by setup_import_corpus.py and test_fix.py; both talk to the same A2A endpoint
+RAGAgentClient = CustomerTrackingClient
 
 
 class CustomerTrackingInteraction:
     """Handles interaction with the Customer Communication Agent."""
     
-    def __init__(self, agent_url: str = "http://localhost:8006"):
-        """Initialize with agent URL."""
-        self.client = CustomerTrackingClient(agent_url)
+    def __init__(
+        self,
+        agent_url: str = "http://localhost:8006",
+        httpx_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """Initialize with agent URL and an optional shared AsyncClient."""
+        self.client = CustomerTrackingClient(agent_url, httpx_client=httpx_client)
     
     async def interactive_session(self):
         """Run interactive session with the agent.
@@ -161,8 +303,8 @@ class CustomerTrackingInteraction:
             print("   - When will my package arrive now?\n")
             
             while True:
-                # Get user input
-                user_input = input("You: ").strip()
+                # Get user input without blocking the event loop
+                user_input = (await ainput("You: ")).strip()
                 
                 if user_input.lower() in ['exit', 'quit']:
                     break
@@ -230,18 +372,35 @@ class CustomerTrackingInteraction:
         ]
         
         try:
-            await self.client.connect()
-            print("✅ Connected to agent\n")
             print("Running automated tests...\n")
             
-            for i, scenario in enumerate(test_scenarios, 1):
-                print(f"📝 Test {i}/{len(test_scenarios)}: {scenario['description']}")
-                print(f"   Message: \"{scenario['message']}\"")
-                response = await self.client.send_message(scenario['message'])
-                print(f"   Response: {response}\n")
-                await asyncio.sleep(1)  # Rate limiting
-                
-            print("✅ All tests completed!")
+            # Encode every scenario once; the payloads can be replayed as-is
+            payloads = self.client.encode_requests(
+                [scenario['message'] for scenario in test_scenarios]
+            )
+            
+            # Fetch the agent card while only the first request is in flight;
+            # if the probe fails, the task group cancels that request and the
+            # rest are never sent
+            try:
+                async with asyncio.TaskGroup() as group:
+                    group.create_task(self.client.connect())
+                    first = group.create_task(self.client.send_requests(payloads[:1]))
+            except ExceptionGroup as eg:
+                raise eg.exceptions[0]
+            responses = first.result() + await self.client.send_requests(payloads[1:])
+            print()
+            
+            # Buffer the report and write it in one go
+            total = len(test_scenarios)
+            lines = []
+            for i, (scenario, response) in enumerate(zip(test_scenarios, responses), 1):
+                lines.append(f"📝 Test {i}/{total}: {scenario['description']}\n")
+                lines.append(f"   Message: \"{scenario['message']}\"\n")
+                lines.append(f"   Response: {response}\n\n")
+            lines.append("✅ All tests completed!\n")
+            sys.stdout.write("".join(lines))
+            sys.stdout.flush()
                 
         except Exception as e:
             print(f"❌ Test failed: {e}")
@@ -267,6 +426,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    
     print("📦 Customer Communication Agent Client (A2A)")
     print("Make sure the A2A server is running: python __main__.py")
     print("Run with --test flag for automated tests\n")
@@ -274,4 +439,11 @@ if __name__ == "__main__":
     print("  - ABC123: Miami → New York (delayed)")
     print("  - XYZ789: Los Angeles → Chicago (in transit)\n")
     
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is None:
+        asyncio.run(main())
+    elif sys.version_info >= (3, 12):
+        # uvloop.install() is deprecated from 3.12; pass a loop factory instead
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
+    else:
+        uvloop.install()
+        asyncio.run(main())
\ No newline at end of file
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from typing import Optional
 
 
-class AnomalyType(Enum):
+class AnomalyType(StrEnum):
     TRAFFIC_JAM = "traffic_jam"
     WEATHER = "weather"
     VEHICLE_BREAKDOWN = "vehicle_breakdown"
@@ -15,14 +15,14 @@ class AnomalyType(Enum):
     OTHER = "other"
 
 
-class AnomalySeverity(Enum):
+class AnomalySeverity(StrEnum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class Anomaly:
     anomaly_id: str
     ticket_id: str
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from typing import Optional, List
 
 
-class UpdateTone(Enum):
+class UpdateTone(StrEnum):
     FORMAL = "formal"
     PROFESSIONAL = "professional"
     APOLOGETIC = "apologetic"
@@ -12,7 +12,7 @@ class UpdateTone(Enum):
     URGENT = "urgent"
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerUpdate:
     update_id: str
     ticket_id: str
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from typing import Optional
 
 
-class ShipmentStatus(Enum):
+class ShipmentStatus(StrEnum):
     IN_TRANSIT = "in_transit"
     DELAYED = "delayed"
     DELIVERED = "delivered"
@@ -12,7 +12,7 @@ class ShipmentStatus(Enum):
     ON_HOLD = "on_hold"
 
 
-@dataclass
+@dataclass(slots=True)
 class Shipment:
     ticket_id: str
     origin: str
@@ -1,3 +1,3 @@
-from .card import get_agent_card
+from .card import get_agent_card, get_agent_card_json
 
-__all__ = ['get_agent_card']
\ No newline at end of file
+__all__ = ['get_agent_card', 'get_agent_card_json']
\ No newline at end of file
@@ -1,102 +1,151 @@
-from a2a.types import AgentCard, AgentCapabilities, AgentSkill
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Final
+
+from a2a.types import AgentCapabilities, AgentCard, AgentSkill
+from pydantic import TypeAdapter
 from app.infrastructure.config import settings
 
+# Capabilities are constant for the deployment; built once and shared
+_CAPABILITIES: Final[AgentCapabilities] = AgentCapabilities(
+    streaming=True,
+    multimodal=False,
+    customMetadata={
+        "supported_operations": (
+            "check_shipment_status",
+            "explain_delay_reason",
+            "provide_new_eta",
+            "handle_customer_inquiry",
+            "generate_status_update",
+            "offer_compensation"
+        ),
+        "llm_model": settings.AGENT_MODEL,
+        "auth_method": "api_key",
+        "specialization": "customer_communication",
+        "tone_modes": ("formal", "professional", "apologetic", "reassuring", "urgent"),
+        "languages": ("en",),
+        "response_time_sla": "< 2 seconds"
+    }
+)
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class SkillSpec:
+    """Lightweight, immutable skill definition used inside this module.
+
+    Converted to the SDK's `AgentSkill` model only at the card boundary.
+    """
+    id: str
+    name: str
+    description: str
+    tags: tuple[str, ...]
+    examples: tuple[str, ...]
+
+
+# Skill definitions, validated together in a single pass
+_SKILL_SPECS: Final[tuple[SkillSpec, ...]] = (
+    SkillSpec(
+        id="shipment_status_inquiry",
+        name="Shipment Status Inquiry",
+        description="Respond to customer inquiries about shipment status and current location",
+        tags=("shipment", "status", "tracking", "inquiry"),
+        examples=(
+            "What's the status of my shipment #ABC123?",
+            "Where is my package with ticket ID XYZ789?",
+            "Has my order #123456 been delivered yet?",
+        )
+    ),
+    SkillSpec(
+        id="delay_explanation",
+        name="Delay Explanation",
+        description="Explain reasons for shipment delays with appropriate tone and context",
+        tags=("delay", "explanation", "anomaly", "communication"),
+        examples=(
+            "Why is my shipment delayed?",
+            "What happened to my package #ABC123?",
+            "Can you explain the delay with my order?",
+        )
+    ),
+    SkillSpec(
+        id="eta_updates",
+        name="ETA Updates",
+        description="Provide updated estimated time of arrival for delayed shipments",
+        tags=("eta", "delivery", "time", "update"),
+        examples=(
+            "When will my package arrive now?",
+            "What's the new delivery date for #ABC123?",
+            "How long is the delay going to be?",
+        )
+    ),
+    SkillSpec(
+        id="proactive_updates",
+        name="Proactive Status Updates",
+        description="Generate proactive customer notifications about shipment anomalies",
+        tags=("proactive", "notification", "update", "anomaly"),
+        examples=(
+            "Generate an update for a 2-hour traffic delay",
+            "Create a weather delay notification",
+            "Notify customer about vehicle breakdown",
+        )
+    ),
+    SkillSpec(
+        id="compensation_handling",
+        name="Compensation and Support",
+        description="Handle compensation offers and support requests for major delays",
+        tags=("compensation", "support", "customer_service", "delay"),
+        examples=(
+            "What compensation can you offer for this delay?",
+            "I need help with my delayed shipment",
+            "This delay is unacceptable, what are you doing about it?",
+        )
+    ),
+)
+_SKILLS: Final[list[AgentSkill]] = TypeAdapter(list[AgentSkill]).validate_python(
+    _SKILL_SPECS, from_attributes=True
+)
+
+# Card content as plain data; validated into an AgentCard and serialized once
+# at import, when _CARD_JSON_BYTES is built below.
+# Collections are tuples: constant-folded by the compiler and never mutated.
+_CARD_DICT: dict = {
+    # Basic metadata
+    "name": "Customer Communication Agent",
+    "description": "AI agent specialized in customer communication for shipment tracking and anomaly updates. Provides tone-aware, professional responses about delays, ETAs, and shipment status.",
+    "version": "1.0.0",
+    "url": "http://localhost:8006/",
+
+    # Input/output modes
+    "defaultInputModes": ("text/plain",),
+    "defaultOutputModes": ("text/plain",),
+
+    # Capabilities
+    "capabilities": _CAPABILITIES,
+
+    # Skills
+    "skills": _SKILLS,
+}
+
+
+@lru_cache(maxsize=1)
 def get_agent_card() -> AgentCard:
     """Get the agent card for Customer Communication Agent.
-    
+
     This agent specializes in communicating with customers about
     shipment anomalies, delays, and ETA updates with appropriate
     tone awareness.
+
+    CACHED: The card never changes during the process lifetime, so it
+    is validated once (in a single pass over the nested data) and the
+    same instance is returned on every call.
     """
-    return AgentCard(
-        # Basic metadata
-        name="Customer Communication Agent",
-        description="AI agent specialized in customer communication for shipment tracking and anomaly updates. Provides tone-aware, professional responses about delays, ETAs, and shipment status.",
-        version="1.0.0",
-        url="http://localhost:8006/",
-        
-        # Input/output modes
-        defaultInputModes=["text/plain"],
-        defaultOutputModes=["text/plain"],
-        
-        # Capabilities
-        capabilities=AgentCapabilities(
-            streaming=True,
-            multimodal=False,
-            customMetadata={
-                "supported_operations": [
-                    "check_shipment_status",
-                    "explain_delay_reason", 
-                    "provide_new_eta",
-                    "handle_customer_inquiry",
-                    "generate_status_update",
-                    "offer_compensation"
-                ],
-                "llm_model": settings.AGENT_MODEL,
-                "auth_method": "api_key",
-                "specialization": "customer_communication",
-                "tone_modes": ["formal", "professional", "apologetic", "reassuring", "urgent"],
-                "languages": ["en"],
-                "response_time_sla": "< 2 seconds"
-            }
-        ),
-        
-         # Skills
-        skills=[
-            AgentSkill(
-                id="shipment_status_inquiry",
-                name="Shipment Status Inquiry",
-                description="Respond to customer inquiries about shipment status and current location",
-                tags=["shipment", "status", "tracking", "inquiry"],
-                examples=[
-                    "What's the status of my shipment #ABC123?",
-                    "Where is my package with ticket ID XYZ789?",
-                    "Has my order #123456 been delivered yet?"
-                ]
-            ),
-            AgentSkill(
-                id="delay_explanation",
-                name="Delay Explanation",
-                description="Explain reasons for shipment delays with appropriate tone and context",
-                tags=["delay", "explanation", "anomaly", "communication"],
-                examples=[
-                    "Why is my shipment delayed?",
-                    "What happened to my package #ABC123?",
-                    "Can you explain the delay with my order?"
-                ]
-            ),
-            AgentSkill(
-                id="eta_updates",
-                name="ETA Updates",
-                description="Provide updated estimated time of arrival for delayed shipments",
-                tags=["eta", "delivery", "time", "update"],
-                examples=[
-                    "When will my package arrive now?",
-                    "What's the new delivery date for #ABC123?",
-                    "How long is the delay going to be?"
-                ]
-            ),
-            AgentSkill(
-                id="proactive_updates",
-                name="Proactive Status Updates",
-                description="Generate proactive customer notifications about shipment anomalies",
-                tags=["proactive", "notification", "update", "anomaly"],
-                examples=[
-                    "Generate an update for a 2-hour traffic delay",
-                    "Create a weather delay notification",
-                    "Notify customer about vehicle breakdown"
-                ]
-            ),
-            AgentSkill(
-                id="compensation_handling",
-                name="Compensation and Support",
-                description="Handle compensation offers and support requests for major delays",
-                tags=["compensation", "support", "customer_service", "delay"],
-                examples=[
-                    "What compensation can you offer for this delay?",
-                    "I need help with my delayed shipment",
-                    "This delay is unacceptable, what are you doing about it?"
-                ]
-            )
-        ]
-    )
\ No newline at end of file
+    return AgentCard.model_validate(_CARD_DICT)
+
+
+# Serialized once at import with the same options the A2A server uses for
+# `/.well-known/agent.json` (camelCase fields, `None` values omitted)
+_CARD_JSON_BYTES: bytes = get_agent_card().model_dump_json(exclude_none=True).encode("utf-8")
+
+
+def get_agent_card_json() -> bytes:
+    """Get the agent card as pre-serialized JSON bytes."""
+    return _CARD_JSON_BYTES
@@ -1,4 +1,5 @@
-from google.adk.agents import Agent
+from typing import TYPE_CHECKING, Final, Optional
+
 from app.infrastructure.config import settings
 
 # Import tools
@@ -7,19 +8,12 @@ from app.infrastructure.tools.get_anomaly_details import get_anomaly_details
 from app.infrastructure.tools.calculate_new_eta import calculate_new_eta
 from app.infrastructure.tools.generate_customer_message import generate_customer_message
 
+if TYPE_CHECKING:
+    from google.adk.agents import Agent
+
 
-# Create the Customer Communication ADK agent
-root_agent = Agent(
-    name="CustomerCommunicationAgent",
-    model=settings.AGENT_MODEL,
-    description="AI agent specialized in customer communication for shipment tracking and anomaly updates",
-    tools=[
-        check_shipment_status,
-        get_anomaly_details,
-        calculate_new_eta,
-        generate_customer_message,
-    ],
-    instruction="""
+# Agent instructions, kept as a module constant so the text is built once
+INSTRUCTION: Final[str] = """
     # 📦 Customer Communication Agent
     
     You are a professional customer service AI agent specializing in shipment tracking and communication. Your primary role is to respond to customer inquiries about their shipments and proactively communicate about delays or anomalies.
@@ -96,4 +90,42 @@ root_agent = Agent(
     
     Remember: You represent the company's commitment to customer satisfaction. Every interaction should leave the customer feeling heard, informed, and valued.
     """
-)
\ No newline at end of file
+
+
+_root_agent: Optional["Agent"] = None
+
+
+def _build_root_agent() -> "Agent":
+    """Create the Customer Communication ADK agent.
+    
+    The ADK import is deferred to here so importing this module does not
+    load the ADK agent stack until `root_agent` is first used.
+    """
+    from google.adk.agents import Agent
+
+    return Agent(
+        name="CustomerCommunicationAgent",
+        model=settings.AGENT_MODEL,
+        description="AI agent specialized in customer communication for shipment tracking and anomaly updates",
+        tools=[
+            check_shipment_status,
+            get_anomaly_details,
+            calculate_new_eta,
+            generate_customer_message,
+        ],
+        instruction=INSTRUCTION,
+    )
+
+
+def __getattr__(name: str):
+    """Build `root_agent` on first access (PEP 562).
+    
+    LAZY: Importing this module (e.g. for INSTRUCTION) does not construct
+    the agent; the same instance is returned on every access.
+    """
+    global _root_agent
+    if name == "root_agent":
+        if _root_agent is None:
+            _root_agent = _build_root_agent()
+        return _root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,59 @@
 """Settings for the A2A server."""
 import os
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Optional
+
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
 
-# Server settings
-HOST = os.getenv("A2A_HOST", "0.0.0.0")
-PORT = int(os.getenv("A2A_PORT", "8006"))
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """A2A server settings, read from the environment once per process."""
+    # Server settings
+    HOST: str
+    PORT: int
+    WORKERS: int  # Tasks are per process, so >1 breaks task follow-ups
+    KEEP_ALIVE: int  # Seconds an idle keep-alive connection stays open
+    BACKLOG: int
+    LOG_LEVEL: str
+
+    # Vertex AI settings
+    PROJECT_ID: Optional[str]
+    LOCATION: str
+
+    # Agent settings
+    AGENT_MODEL: str
+    
+    # Session storage (SQLAlchemy URL); in-memory when unset
+    SESSION_DB_URL: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings from the environment (and `.env`) on first use."""
+    # Load environment variables
+    load_dotenv()
+
+    return Settings(
+        HOST=os.getenv("A2A_HOST", "0.0.0.0"),
+        PORT=int(os.getenv("A2A_PORT", "8006")),
+        WORKERS=int(os.getenv("A2A_WORKERS", "1")),
+        KEEP_ALIVE=int(os.getenv("A2A_KEEP_ALIVE", "30")),
+        BACKLOG=int(os.getenv("A2A_BACKLOG", "2048")),
+        LOG_LEVEL=os.getenv("LOG_LEVEL", "INFO").upper(),
+        PROJECT_ID=os.getenv("GOOGLE_CLOUD_PROJECT"),
+        LOCATION=os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1"),
+        AGENT_MODEL=os.getenv("AGENT_MODEL", "gemini-2.0-flash-exp"),
+        SESSION_DB_URL=os.getenv("SESSION_DB_URL") or None,
+    )
+
+
+_SETTING_NAMES = frozenset(field.name for field in fields(Settings))
 
-# Vertex AI settings
-PROJECT_ID = os.getenv("GOOGLE_CLOUD_PROJECT")
-LOCATION = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
 
-# Agent settings
-AGENT_MODEL = os.getenv("AGENT_MODEL", "gemini-2.0-flash-exp")
\ No newline at end of file
+def __getattr__(name: str):
+    """Keep `settings.AGENT_MODEL`-style access working (PEP 562)."""
+    if name in _SETTING_NAMES:
+        return getattr(get_settings(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -20,6 +20,14 @@ MOCK_WEATHER_CONDITIONS = {
     "snow": 2.5
 }
 
+# Condition names as tuples, so choice() can index them directly
+_TRAFFIC_KEYS = tuple(MOCK_TRAFFIC_CONDITIONS)
+_WEATHER_KEYS = tuple(MOCK_WEATHER_CONDITIONS)
+
+# Private generator for the mock conditions, independent of the global
+# random state and its module-level function lookups
+_RNG = random.Random()
+
 
 def calculate_new_eta(
     ticket_id: str,
@@ -38,6 +46,9 @@ def calculate_new_eta(
     Returns:
         Dictionary containing new ETA calculation details
     """
+    # Single clock read per call, shared by the guard and the timestamp
+    now = datetime.now()
+    
     # Parse original ETA
     original_dt = datetime.fromisoformat(original_eta)
     
@@ -67,8 +78,8 @@ def calculate_new_eta(
     
     # Mock API calls for current conditions
     # In production, these would be real API calls
-    current_traffic = random.choice(list(MOCK_TRAFFIC_CONDITIONS.keys()))
-    current_weather = random.choice(list(MOCK_WEATHER_CONDITIONS.keys()))
+    current_traffic = _RNG.choice(_TRAFFIC_KEYS)
+    current_weather = _RNG.choice(_WEATHER_KEYS)
     
     traffic_factor = MOCK_TRAFFIC_CONDITIONS[current_traffic]
     weather_factor = MOCK_WEATHER_CONDITIONS[current_weather]
@@ -77,15 +88,15 @@ def calculate_new_eta(
     total_delay_hours = base_delay_hours * multiplier * traffic_factor * weather_factor
     
     # Add some randomness for realism (±15%)
-    variance = random.uniform(0.85, 1.15)
+    variance = _RNG.uniform(0.85, 1.15)
     total_delay_hours *= variance
     
     # Calculate new ETA
     new_eta = original_dt + timedelta(hours=total_delay_hours)
     
     # Ensure new ETA is in the future
-    if new_eta <= datetime.now():
-        new_eta = datetime.now() + timedelta(hours=1)
+    if new_eta <= now:
+        new_eta = now + timedelta(hours=1)
         total_delay_hours = (new_eta - original_dt).total_seconds() / 3600
     
     # Calculate confidence based on data quality
@@ -111,5 +122,5 @@ def calculate_new_eta(
             "weather": current_weather
         },
         "confidence_level": round(confidence, 2),
-        "last_updated": datetime.now().isoformat()
+        "last_updated": now.isoformat()
     }
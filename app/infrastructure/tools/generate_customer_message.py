@@ -1,7 +1,9 @@
 from app.domain.entities.customer_update import UpdateTone
+from bisect import bisect_left
 from datetime import datetime
+from functools import lru_cache
+from secrets import token_hex
 from typing import Dict, Any, Optional
-import uuid
 
 
 MESSAGE_TEMPLATES = {
@@ -75,6 +77,34 @@ Your Logistics Team"""
     }
 }
 
+# Fixed message fragments, built once at import
+_COMPENSATION_TEXT = "\n\nAs an apology for this significant delay, we'd like to offer you a 15% discount on your next shipment."
+
+# Template for every (message_type, tone) pair, with the fallbacks already
+# applied: a tone without its own template uses the professional one, and
+# unknown message types fall back to "status_update"
+_TEMPLATES_BY_KEY: Dict[tuple[str, str], str] = {
+    (message_type, tone.value): templates.get(tone, templates[UpdateTone.PROFESSIONAL])
+    for message_type, templates in MESSAGE_TEMPLATES.items()
+    for tone in UpdateTone
+}
+_TONE_VALUES = frozenset(tone.value for tone in UpdateTone)
+
+# Delay severity by hours: <= 2 low, <= 4 medium, otherwise high
+_SEVERITY_BUCKETS = (2.0, 4.0)
+_SEVERITY_TABLE = ("low", "medium", "high")
+
+_DISPLAY_FMT = "%B %d, %Y at %I:%M %p"
+
+
+@lru_cache(maxsize=1024)
+def _fmt_iso_for_display(iso: str) -> str:
+    """Format an ISO timestamp for customer-facing text.
+    
+    CACHED: The same ETA is typically formatted for several messages.
+    """
+    return datetime.fromisoformat(iso).strftime(_DISPLAY_FMT)
+
 
 def generate_customer_message(
     ticket_id: str,
@@ -105,32 +135,31 @@ def generate_customer_message(
     Returns:
         Dictionary containing the generated message and metadata
     """
-    # Convert tone string to enum
-    tone_enum = UpdateTone(tone.lower())
+    # Missing delay is treated as no delay
+    dh = delay_hours or 0.0
+    
+    # Validate tone (same error as UpdateTone(tone) would raise)
+    tone_key = tone.lower()
+    if tone_key not in _TONE_VALUES:
+        raise ValueError(f"{tone_key!r} is not a valid UpdateTone")
     
     # Get appropriate template
-    templates = MESSAGE_TEMPLATES.get(message_type, MESSAGE_TEMPLATES["status_update"])
-    template = templates.get(tone_enum, templates[UpdateTone.PROFESSIONAL])
+    template = (
+        _TEMPLATES_BY_KEY.get((message_type, tone_key))
+        or _TEMPLATES_BY_KEY[("status_update", tone_key)]
+    )
     
     # Prepare compensation text if needed
     compensation_text = ""
-    if offer_compensation and delay_hours and delay_hours > 4:
-        compensation_text = "\n\nAs an apology for this significant delay, we'd like to offer you a 15% discount on your next shipment."
+    if offer_compensation and dh > 4:
+        compensation_text = _COMPENSATION_TEXT
     
     # Format dates for readability
-    if original_eta:
-        original_dt = datetime.fromisoformat(original_eta)
-        original_eta_formatted = original_dt.strftime("%B %d, %Y at %I:%M %p")
-    else:
-        original_eta_formatted = "Not specified"
-        
-    if new_eta:
-        new_dt = datetime.fromisoformat(new_eta)
-        new_eta_formatted = new_dt.strftime("%B %d, %Y at %I:%M %p")
-    else:
-        new_eta_formatted = "To be determined"
+    original_eta_formatted = _fmt_iso_for_display(original_eta) if original_eta else "Not specified"
+    new_eta_formatted = _fmt_iso_for_display(new_eta) if new_eta else "To be determined"
     
     # Prepare context
+    extra = additional_context or {}
     context_data = {
         "customer_name": customer_name,
         "ticket_id": ticket_id,
@@ -141,16 +170,16 @@ def generate_customer_message(
         "delay_hours": round(delay_hours, 1) if delay_hours else 0,
         "compensation_text": compensation_text,
         "status": "In Transit - Delayed" if delay_hours else "In Transit",
-        "origin": additional_context.get("origin", "Origin") if additional_context else "Origin",
-        "destination": additional_context.get("destination", "Destination") if additional_context else "Destination",
-        "additional_info": additional_context.get("notes", "") if additional_context else ""
+        "origin": extra.get("origin", "Origin"),
+        "destination": extra.get("destination", "Destination"),
+        "additional_info": extra.get("notes", "")
     }
     
     # Generate message
     message = template.format(**context_data)
     
     # Generate metadata
-    update_id = f"UPD-{uuid.uuid4().hex[:8].upper()}"
+    update_id = f"UPD-{token_hex(4).upper()}"
     
     return {
         "update_id": update_id,
@@ -161,8 +190,8 @@ def generate_customer_message(
         "subject": f"Shipment #{ticket_id} - {message_type.replace('_', ' ').title()}",
         "message": message.strip(),
         "includes_compensation": offer_compensation,
-        "delay_severity": "high" if delay_hours and delay_hours > 4 else "medium" if delay_hours and delay_hours > 2 else "low",
-        "follow_up_needed": delay_hours and delay_hours > 6 if delay_hours else False,
+        "delay_severity": _SEVERITY_TABLE[bisect_left(_SEVERITY_BUCKETS, dh)],
+        "follow_up_needed": dh > 6,
         "metadata": {
             "original_eta": original_eta,
             "new_eta": new_eta,
@@ -0,0 +1,54 @@
+"""Route serving the pre-serialized agent card."""
+import hashlib
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from app.infrastructure.a2a import get_agent_card_json
+
+AGENT_CARD_PATH = "/.well-known/agent.json"
+
+# The card is immutable for the process lifetime, so its validator is fixed too.
+# BLAKE2 is used as a fast content hash, not for security.
+_ETAG = '"' + hashlib.blake2b(get_agent_card_json(), digest_size=16).hexdigest() + '"'
+_CACHE_HEADERS = {
+    "ETag": _ETAG,
+    "Cache-Control": "public, max-age=3600, immutable",
+}
+
+
+def _etag_matches(if_none_match: str) -> bool:
+    """Check an If-None-Match header value against the card's ETag."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == _ETAG:
+            return True
+    return False
+
+
+async def _agent_card_endpoint(request: Request) -> Response:
+    """Return the agent card bytes without re-serializing the model.
+
+    CACHING: Clients revalidating with a matching If-None-Match get an
+    empty 304 response.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match):
+        return Response(status_code=304, headers=_CACHE_HEADERS)
+    return Response(
+        content=get_agent_card_json(),
+        media_type="application/json",
+        headers=_CACHE_HEADERS,
+    )
+
+
+def add_agent_card_route(app: Starlette, path: str = AGENT_CARD_PATH) -> None:
+    """Serve the agent card from pre-serialized bytes.
+
+    ROUTING: Starlette matches routes in order, so inserting this route
+    first shadows the A2A SDK's handler, which dumps the Pydantic model
+    on every request.
+    """
+    app.router.routes.insert(0, Route(path, _agent_card_endpoint, methods=["GET"]))
@@ -1,6 +1,9 @@
 import asyncio
+import base64
 import inspect
 import logging
+import uuid
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
 
 from a2a.server.agent_execution import AgentExecutor
@@ -17,12 +20,22 @@ from a2a.types import (
     UnsupportedOperationError,
 )
 from a2a.utils.errors import ServerError
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.runners import Runner
 from google.adk.events import Event
 from google.genai import types
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+
+# Maximum number of sessions remembered by an executor
+SESSION_CACHE_SIZE = 1024
+
+# All A2A conversations run as this ADK user
+_USER_ID = "rag_agent_user"
+
+# SSE streaming makes the Runner yield partial text events as the model
+# generates them, ahead of the aggregated final response
+_RUN_CONFIG = RunConfig(streaming_mode=StreamingMode.SSE)
 
 
 class RAGAgentExecutor(AgentExecutor):
@@ -35,6 +48,12 @@ class RAGAgentExecutor(AgentExecutor):
     def __init__(self, runner: Runner):
         self.runner = runner
         self._running_sessions = {}
+        # Bound once; used on every request
+        self._app_name = runner.app_name
+        self._get_session = runner.session_service.get_session
+        self._create_session = runner.session_service.create_session
+        # Most recently used sessions, oldest first
+        self._session_cache = OrderedDict()
 
     def _run_agent(
         self, session_id: str, new_message: types.Content
@@ -43,13 +62,14 @@ class RAGAgentExecutor(AgentExecutor):
         
         RUNNER: Uses ADK Runner to execute the agent with session management.
         """
-        logger.debug(f"_run_agent called with session_id={session_id}")
+        logger.debug("_run_agent called with session_id=%s", session_id)
         # Note: Despite being called run_async, this method returns an AsyncGenerator directly
         # not a coroutine that needs to be awaited
         return self.runner.run_async(
             session_id=session_id, 
-            user_id="rag_agent_user", 
-            new_message=new_message
+            user_id=_USER_ID, 
+            new_message=new_message,
+            run_config=_RUN_CONFIG,
         )
 
     async def _process_request(
@@ -62,12 +82,17 @@ class RAGAgentExecutor(AgentExecutor):
         
         EVENT HANDLING: Processes events from the agent execution
         and updates the task status accordingly.
+        
+        STREAMING: Partial events are appended to the response artifact as
+        they arrive, each carrying only its new chunk of text. The final
+        response then replaces that artifact with the complete parts, so
+        the stored task ends up the same as a non-streamed one.
         """
         # Ensure session exists
         session_obj = await self._upsert_session(session_id)
         # Debug logging
-        logger.debug(f"Session object type: {type(session_obj)}")
-        logger.debug(f"Session object: {session_obj}")
+        logger.debug("Session object type: %s", type(session_obj))
+        logger.debug("Session object: %s", session_obj)
         
         # Extract session ID - handle both Session objects and dicts
         if hasattr(session_obj, 'id'):
@@ -75,10 +100,15 @@ class RAGAgentExecutor(AgentExecutor):
         elif isinstance(session_obj, dict) and 'id' in session_obj:
             session_id = session_obj['id']
         else:
-            logger.error(f"Unexpected session object type: {type(session_obj)}")
+            logger.error("Unexpected session object type: %s", type(session_obj))
             raise ValueError(f"Cannot extract session ID from {type(session_obj)}")
 
-        # Run the agent and process events
+        # All chunks of the response go to one artifact
+        artifact_id = str(uuid.uuid4())
+        streamed = False
+        
+        # Run the agent and process events. Status updates and artifact
+        # chunks are awaited in turn so they reach the queue in event order.
         async for event in self._run_agent(session_id, new_message):
             if event.is_final_response():
                 # Final response from agent
@@ -87,11 +117,24 @@ class RAGAgentExecutor(AgentExecutor):
                 )
                 logger.debug("Yielding final response: %s", parts)
                 
-                # Add response as artifact and complete
-                await task_updater.add_artifact(parts)
+                # Replace the streamed chunks with the full response and complete
+                await task_updater.add_artifact(
+                    parts, artifact_id=artifact_id, append=False, last_chunk=True
+                )
                 await task_updater.complete()
                 break
                 
+            elif event.partial:
+                # Streamed chunk: append its text to the response artifact
+                parts = self._convert_genai_parts_to_a2a(
+                    event.content.parts if event.content and event.content.parts else []
+                )
+                if parts:
+                    await task_updater.add_artifact(
+                        parts, artifact_id=artifact_id, append=streamed, last_chunk=False
+                    )
+                    streamed = True
+                
             elif not event.get_function_calls():
                 # Intermediate update (not a function call)
                 logger.debug("Yielding update response")
@@ -119,7 +162,7 @@ class RAGAgentExecutor(AgentExecutor):
         MAIN ENTRY: Called by A2A when a message is received.
         """
         logger.debug("RAGAgentExecutor.execute called")
-        logger.debug(f"Context: task_id={context.task_id}, context_id={context.context_id}")
+        logger.debug("Context: task_id=%s, context_id=%s", context.task_id, context.context_id)
         
         if not context.task_id or not context.context_id:
             raise ValueError("RequestContext must have task_id and context_id")
@@ -150,99 +193,115 @@ class RAGAgentExecutor(AgentExecutor):
         raise ServerError(error=UnsupportedOperationError())
 
     async def _upsert_session(self, session_id: str):
-        """Get or create a session for the conversation."""
-        # Helper function to handle potential coroutines
-        async def _await_if_needed(obj):
-            if inspect.iscoroutine(obj):
-                return await obj
-            return obj
+        """Get or create a session for the conversation.
+        
+        CACHED: Sessions already seen by this executor are returned from a
+        bounded LRU cache without calling the session service. Only found
+        or created sessions are cached, never misses.
+        """
+        session = self._session_cache.get(session_id)
+        if session is not None:
+            self._session_cache.move_to_end(session_id)
+            return session
         
-        # Get session (might be async)
-        session_obj = self.runner.session_service.get_session(
-            app_name=self.runner.app_name, 
-            user_id="rag_agent_user", 
+        # Get session (sync or async depending on the session service)
+        result = self._get_session(
+            app_name=self._app_name, 
+            user_id=_USER_ID, 
             session_id=session_id
         )
-        session = await _await_if_needed(session_obj)
+        session = await result if inspect.isawaitable(result) else result
         
         if session is None:
-            # Create session (might be async)
-            session_obj = self.runner.session_service.create_session(
-                app_name=self.runner.app_name,
-                user_id="rag_agent_user",
+            # Create session (sync or async depending on the session service)
+            result = self._create_session(
+                app_name=self._app_name,
+                user_id=_USER_ID,
                 session_id=session_id,
             )
-            session = await _await_if_needed(session_obj)
+            session = await result if inspect.isawaitable(result) else result
             
         if session is None:
             raise RuntimeError(f"Failed to get or create session: {session_id}")
+        
+        self._session_cache[session_id] = session
+        if len(self._session_cache) > SESSION_CACHE_SIZE:
+            self._session_cache.popitem(last=False)
         return session
 
     def _convert_a2a_parts_to_genai(self, parts: list[Part]) -> list[types.Part]:
-        """Convert A2A parts to GenAI parts."""
-        return [self._convert_a2a_part_to_genai(part) for part in parts]
-
-    def _convert_a2a_part_to_genai(self, part: Part) -> types.Part:
-        """Convert a single A2A part to GenAI part.
+        """Convert A2A parts to GenAI parts.
         
         CRITICAL: Handles text and file parts for complete compatibility.
+        Conversion is done in a single loop with the part classes bound to
+        locals, since this runs for every incoming message. A2A carries file
+        bytes base64-encoded; GenAI expects the raw bytes.
         """
-        root = part.root
-        if isinstance(root, TextPart):
-            return types.Part(text=root.text)
-        if isinstance(root, FilePart):
-            if isinstance(root.file, FileWithUri):
-                return types.Part(
-                    file_data=types.FileData(
-                        file_uri=root.file.uri, 
-                        mime_type=root.file.mimeType
-                    )
-                )
-            if isinstance(root.file, FileWithBytes):
-                return types.Part(
-                    inline_data=types.Blob(
-                        data=root.file.bytes.encode("utf-8"),
-                        mime_type=root.file.mimeType or "application/octet-stream",
-                    )
-                )
-            raise ValueError(f"Unsupported file type: {type(root.file)}")
-        raise ValueError(f"Unsupported part type: {type(part)}")
+        GenaiPart, FileData, Blob = types.Part, types.FileData, types.Blob
+        out = []
+        append = out.append
+        for part in parts:
+            root = part.root
+            if isinstance(root, TextPart):
+                append(GenaiPart(text=root.text))
+            elif isinstance(root, FilePart):
+                file = root.file
+                if isinstance(file, FileWithUri):
+                    append(GenaiPart(
+                        file_data=FileData(
+                            file_uri=file.uri, 
+                            mime_type=file.mimeType
+                        )
+                    ))
+                elif isinstance(file, FileWithBytes):
+                    append(GenaiPart(
+                        inline_data=Blob(
+                            data=base64.b64decode(file.bytes),
+                            mime_type=file.mimeType or "application/octet-stream",
+                        )
+                    ))
+                else:
+                    raise ValueError(f"Unsupported file type: {type(file)}")
+            else:
+                raise ValueError(f"Unsupported part type: {type(part)}")
+        return out
 
     def _convert_genai_parts_to_a2a(self, parts: list[types.Part]) -> list[Part]:
-        """Convert GenAI parts to A2A parts."""
-        return [
-            self._convert_genai_part_to_a2a(part)
-            for part in parts
-            if (part.text or part.file_data or part.inline_data)
-        ]
-
-    def _convert_genai_part_to_a2a(self, part: types.Part) -> Part:
-        """Convert a single GenAI part to A2A part.
+        """Convert GenAI parts to A2A parts.
         
         CRITICAL: Handles all GenAI part types for complete compatibility.
+        Parts with no text, file data or inline data are skipped.
         """
-        if part.text:
-            return Part(root=TextPart(text=part.text))
-        if part.file_data:
-            if not part.file_data.file_uri:
-                raise ValueError("File URI is missing")
-            return Part(
-                root=FilePart(
-                    file=FileWithUri(
-                        uri=part.file_data.file_uri,
-                        mimeType=part.file_data.mime_type,
+        out = []
+        append = out.append
+        for part in parts:
+            text = part.text
+            if text:
+                append(Part(root=TextPart(text=text)))
+                continue
+            file_data = part.file_data
+            if file_data:
+                if not file_data.file_uri:
+                    raise ValueError("File URI is missing")
+                append(Part(
+                    root=FilePart(
+                        file=FileWithUri(
+                            uri=file_data.file_uri,
+                            mimeType=file_data.mime_type,
+                        )
                     )
-                )
-            )
-        if part.inline_data:
-            if not part.inline_data.data:
-                raise ValueError("Inline data is missing")
-            return Part(
-                root=FilePart(
-                    file=FileWithBytes(
-                        bytes=part.inline_data.data.decode("utf-8"),
-                        mimeType=part.inline_data.mime_type,
+                ))
+                continue
+            inline_data = part.inline_data
+            if inline_data:
+                if not inline_data.data:
+                    raise ValueError("Inline data is missing")
+                append(Part(
+                    root=FilePart(
+                        file=FileWithBytes(
+                            bytes=base64.b64encode(inline_data.data).decode("ascii"),
+                            mimeType=inline_data.mime_type,
+                        )
                     )
-                )
-            )
-        raise ValueError(f"Unsupported part type: {part}")
\ No newline at end of file
+                ))
+        return out
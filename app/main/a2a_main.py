@@ -1,9 +1,12 @@
 import asyncio
 import logging
+import sys
+import uvicorn
 from uvicorn import Config, Server
 
 from app.infrastructure.a2a import get_agent_card
 from app.infrastructure.web.rag_agent_executor import RAGAgentExecutor
+from app.infrastructure.web.agent_card_route import add_agent_card_route
 from app.infrastructure.config import settings
 from app.infrastructure.agent import root_agent
 
@@ -18,13 +21,29 @@ from google.adk.artifacts import InMemoryArtifactService
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.sessions import InMemorySessionService
 
-# Configure logging
+# Configure logging (LOG_LEVEL=DEBUG enables executor debug output)
 logging.basicConfig(
-    level=logging.INFO,
+    level=settings.LOG_LEVEL,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+def create_session_service():
+    """Create the ADK session service.
+    
+    PERSISTENCE: With SESSION_DB_URL set, sessions are stored in that
+    database, so they survive restarts and are shared by all workers.
+    Otherwise they live in this process's memory.
+    
+    OPTIONAL: The database service needs the `google-adk[db]` extra plus
+    an async driver (e.g. aiosqlite), so it is only imported when used.
+    """
+    if settings.SESSION_DB_URL:
+        from google.adk.sessions import DatabaseSessionService
+        
+        return DatabaseSessionService(db_url=settings.SESSION_DB_URL)
+    return InMemorySessionService()
+
 def create_a2a_app():
     """Create A2A application with ADK Runner integration.
     
@@ -43,7 +62,7 @@ def create_a2a_app():
         app_name=agent_card.name,
         agent=root_agent,
         artifact_service=InMemoryArtifactService(),
-        session_service=InMemorySessionService(),
+        session_service=create_session_service(),
         memory_service=InMemoryMemoryService(),
     )
     
@@ -67,9 +86,61 @@ def create_a2a_app():
     
     return app
 
+def create_asgi_app():
+    """Build the ASGI app served by uvicorn.
+    
+    FACTORY: Also used by uvicorn worker processes, which each import
+    this module and build their own app.
+    """
+    # Note: A2AStarletteApplication.build() returns the ASGI app
+    asgi_app = create_a2a_app().build()
+    # Serve the agent card from pre-serialized bytes
+    add_agent_card_route(asgi_app)
+    return asgi_app
+
 def run_server():
-    """Run the A2A server synchronously."""
-    asyncio.run(_run_server_async())
+    """Run the A2A server synchronously.
+    
+    WORKERS: With A2A_WORKERS > 1, uvicorn runs that many worker processes
+    itself. The task store, artifact/memory services and the executor's
+    session cache are always per process (SESSION_DB_URL only shares ADK
+    sessions), so tasks/get, resubscribe and follow-ups carrying a taskId
+    fail when they land on another worker.
+    """
+    if settings.WORKERS > 1:
+        logger.warning(
+            "A2A_WORKERS=%d: tasks are kept in per-process memory, so "
+            "tasks/get, resubscribe and follow-up messages with a taskId only "
+            "work when they reach the worker that created the task",
+            settings.WORKERS,
+        )
+        logger.info(f"🚢 Starting Colombian Import Specialist Server with {settings.WORKERS} workers...")
+        uvicorn.run(
+            "app.main.a2a_main:create_asgi_app",
+            factory=True,
+            host=settings.HOST,
+            port=settings.PORT,
+            workers=settings.WORKERS,
+            timeout_keep_alive=settings.KEEP_ALIVE,
+            backlog=settings.BACKLOG,
+            log_level="info",
+        )
+        return
+    
+    # Use uvloop's faster event loop when it is installed. uvicorn only
+    # selects it when it creates the loop itself, and here asyncio.run does.
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(_run_server_async())
+        return
+    
+    if sys.version_info >= (3, 12):
+        # uvloop.install() is deprecated from 3.12; pass a loop factory instead
+        asyncio.run(_run_server_async(), loop_factory=uvloop.new_event_loop)
+    else:
+        uvloop.install()
+        asyncio.run(_run_server_async())
 
 async def _run_server_async():
     """Run the A2A server with proper lifecycle management.
@@ -83,14 +154,16 @@ async def _run_server_async():
         logger.info("🚢 Starting Colombian Import Specialist Server...")
         
         # Create app
-        app = create_a2a_app()
+        asgi_app = create_asgi_app()
         
         # Configure server
         # CRITICAL: Using port 8006 for A2A server
         config = Config(
-            app=app.build(),  # Note: A2AStarletteApplication.build() returns the ASGI app
+            app=asgi_app,
             host=settings.HOST,  # Default: 0.0.0.0
             port=settings.PORT,  # Default: 8006
+            timeout_keep_alive=settings.KEEP_ALIVE,
+            backlog=settings.BACKLOG,
             log_level="info"
         )
         
@@ -9,8 +9,6 @@ from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.sessions import InMemorySessionService
 from app.infrastructure.agent import root_agent
 
-logging.basicConfig(level=logging.DEBUG)
-
 async def test_session_creation():
     """Test session creation to understand the issue."""
     
@@ -58,4 +56,6 @@ async def test_session_creation():
             print(f"   Session ID: {result.id}")
 
 if __name__ == "__main__":
+    # Only configure DEBUG logging when run as a script, not on import
+    logging.basicConfig(level=logging.DEBUG)
     asyncio.run(test_session_creation())
\ No newline at end of file
@@ -61,9 +61,10 @@ async def test_queries():
             "How are import duties calculated in Colombia?"
         ]
         
-        for query in queries:
+        # Queries are independent, so the client sends them concurrently
+        responses = await client.send_messages(queries)
+        for query, response in zip(queries, responses):
             print(f"\nQ: {query}")
-            response = await client.send_message(query)
             print(f"A: {response}")
             
     except Exception as e: